@@ -1,13 +1,33 @@
-import hashlib
-from dataclasses import dataclass
+import bisect
+from dataclasses import dataclass, field
 import logging
 
-# Configure basic logging for visibility into server assignments
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s][%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+import numpy as np
+import xxhash
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+# numba is optional (the "jit" extra): without it batch lookups use np.searchsorted.
+except ImportError:
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Importing this module must not configure logging for the host application: records go nowhere
+# unless the importer (or the demo below) installs handlers.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# xxh3 (non-cryptographic) gives a uniform 2^64 hash space. Sharding only needs good distribution, not collision
+# resistance, so SHA-256 would be wasted work. Bound once at module level: every lookup hashes exactly one short key,
+# so the serial per-key path is a single C call with no attribute lookups or extra Python frames around it.
+_xxh3_64 = xxhash.xxh3_64_intdigest
 
 
 # frozen=True makes the class immutable and hashable, required for using Node objects in a Python set.
@@ -15,6 +35,13 @@ logging.basicConfig(
 class Node:
     name: str
     ip: str
+    # UTF-8 encoded name, cached once so virtual-node labels are built without re-encoding the name each time.
+    # Excluded from eq/hash/repr: it is derived from `name`.
+    name_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # object.__setattr__ is needed to assign on a frozen dataclass.
+        object.__setattr__(self, "name_bytes", self.name.encode("utf-8"))
 
 
 # --- 1. NORMAL HASHING (MODULO HASHING) ---
@@ -26,16 +53,73 @@ class NormalHashing:
     def get_node(self, key: str) -> int:
         # Standard modulo hashing: Hash the key and take modulo N (number of nodes).
         # H(key) % N
-        hash_value = hashlib.sha256(key.encode("utf-8")).hexdigest()
-        server_index = int(hash_value, 16) % len(self.nodes)
-        logging.info(f"{key} falls into server {server_index}")
-        return server_index
+        hash_value = _xxh3_64(key.encode("utf-8"))
+        # No logging here: formatting and emitting a record per lookup costs far more than the hash itself.
+        # Callers that want to trace assignments log them (see main()).
+        return hash_value % len(self.nodes)
 
     def add_node(self, node: Node) -> None:
         # Appending changes N, causing massive re-mapping of all keys.
         self.nodes.append(node)
 
 
+# --- Ring lookup helpers (used by ConsistentHashing below) ---
+# Batch ring lookup compiled to native code: the per-key binary search is a tight scalar loop, and every key
+# is independent, so numba runs the batch in parallel across cores.
+@njit(cache=True, parallel=True)
+def _lookup_batch(
+    ring_hashes: np.ndarray, key_hashes: np.ndarray, out: np.ndarray
+) -> None:
+    for i in prange(key_hashes.size):
+        h = key_hashes[i]
+        lo, hi = 0, ring_hashes.size
+        # Lower bound: first ring hash >= h.
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ring_hashes[mid] < h:
+                lo = mid + 1
+            else:
+                hi = mid
+        # Wrap-around past the last ring hash.
+        out[i] = 0 if lo == ring_hashes.size else lo
+
+
+def _make_ring_lookup(ring_hashes: list[int], ring_nodes: list[Node], live: list[bool]):
+    # Builds a lookup function specialised to one ring snapshot. The snapshot and bisect are bound as default
+    # arguments, i.e. fast locals: a lookup does no attribute loads on self and no global lookups.
+    # Rebuilt by ConsistentHashing._set_ring whenever the ring arrays change. `live` holds one flag per ring
+    # entry and is mutated in place, so removals take effect without a rebuild.
+    if not ring_hashes:
+        return lambda hash_value: None
+
+    def lookup(
+        hash_value: int,
+        _bisect_left=bisect.bisect_left,
+        _hashes=ring_hashes,
+        _nodes=ring_nodes,
+        _size=len(ring_hashes),
+        _live=live,
+    ) -> Node | None:
+        # Find the index of the first node hash >= key hash (the 'lower bound').
+        # This implements the "walk clockwise" rule of consistent hashing.
+        # For a single key, bisect over a list beats np.searchsorted, whose per-call overhead dominates.
+        idx = _bisect_left(_hashes, hash_value)
+        # Handle wrap-around: If idx is out of bounds (key hash > all node hashes),
+        # the key wraps back to the first node (index 0).
+        start = 0 if idx == _size else idx
+        if _live[start]:
+            return _nodes[start]
+        # Tombstoned (removed but not yet compacted): keep walking clockwise to the first live entry,
+        # exactly where the key would land if the removed entries were physically gone.
+        for step in range(1, _size):
+            i = (start + step) % _size
+            if _live[i]:
+                return _nodes[i]
+        return None
+
+    return lookup
+
+
 # --- 2. CONSISTENT HASHING ---
 # Minimizes key re-mapping when nodes are added or removed.
 class ConsistentHashing:
@@ -44,66 +128,381 @@ class ConsistentHashing:
         self.virtual_nodes = virtual_nodes
         # self.nodes: Tracks the set of real, physical Node objects.
         self.nodes = set()
-        # self.hash_ring: The core data structure - a sorted list of (hash_value, Node) tuples.
-        self.hash_ring: list[tuple[int, Node]] = []
-        for node in nodes:
-            self.add_node(node)
+        # Each physical node's virtual-node hashes, so removal can find its ring entries by hash.
+        self._per_node: dict[Node, np.ndarray] = {}
+        # Removed nodes whose entries are still on the ring (flagged dead in self._live) until _compact() drops them.
+        self._tombstones: set[Node] = set()
+        # The hash ring, stored as two parallel sorted arrays (struct-of-arrays) rather than (hash, Node) tuples:
+        # hashes live in one contiguous uint64 buffer (8 bytes each), and the owning node is read only once at the end.
+        self._set_ring(np.empty(0, dtype=np.uint64), np.empty(0, dtype=object))
+        # Bulk construction: one batch hash and one sort-merge for all N*V virtual nodes.
+        self._add_nodes(nodes)
+
+    def _hash_many(self, labels: list[bytes]) -> np.ndarray:
+        # Batch hashing: one C-level map over pre-encoded labels straight into a uint64 array,
+        # instead of a Python-level call and an int box per label.
+        return np.fromiter(map(_xxh3_64, labels), dtype=np.uint64, count=len(labels))
+
+    def _labels(self, node: Node) -> list[bytes]:
+        # Create 'virtual_nodes' to improve key distribution and load balancing.
+        # Each virtual node gets a unique label, which is hashed to its position on the ring.
+        # Built straight from the cached name bytes ("<name>:<i>"): ~2x faster than formatting and encoding a str.
+        return [b"%s:%d" % (node.name_bytes, i) for i in range(self.virtual_nodes)]
+
+    def _add_nodes(self, nodes: list[Node]) -> None:
+        # Hash all new labels in one batch and sort them once, then merge into the ring in a single linear pass:
+        # O(R + K log K) for K new virtual nodes, instead of one O(R) array copy per virtual node.
+        new_nodes = [node for node in dict.fromkeys(nodes) if node not in self.nodes]
+        # A tombstoned node still has all of its entries on the ring: re-adding it just revives them.
+        revived = [node for node in new_nodes if node in self._tombstones]
+        if revived:
+            self._tombstones.difference_update(revived)
+            self.nodes.update(revived)
+            for node in revived:
+                self._mark(node, True)
+            new_nodes = [node for node in new_nodes if node not in self.nodes]
+        if not new_nodes:
+            return
+        self.nodes.update(new_nodes)
+        hash_values = self._hash_many(
+            [label for node in new_nodes for label in self._labels(node)]
+        )
+        V = self.virtual_nodes
+        for i, node in enumerate(new_nodes):
+            self._per_node[node] = hash_values[i * V : (i + 1) * V]
+        owners = np.repeat(np.array(new_nodes, dtype=object), V)
+        order = np.argsort(hash_values, kind="stable")
+        hash_values, owners = hash_values[order], owners[order]
+
+        # Each new entry's final slot is its lower bound in the old ring plus the number of new entries before it;
+        # the old entries fill the remaining slots in order. Both arrays share the same slot computation.
+        offsets = np.arange(hash_values.size)
+        new_slots = self._ring_hashes.searchsorted(hash_values) + offsets
+        size = self._ring_hashes.size + hash_values.size
+        old_slots = np.ones(size, dtype=bool)
+        old_slots[new_slots] = False
+        ring_hashes = np.empty(size, dtype=np.uint64)
+        ring_hashes[new_slots] = hash_values
+        ring_hashes[old_slots] = self._ring_hashes
+        ring_nodes = np.empty(size, dtype=object)
+        ring_nodes[new_slots] = owners
+        ring_nodes[old_slots] = self._ring_nodes
+        self._set_ring(ring_hashes, ring_nodes)
 
-    def _hash(self, key: str) -> int:
-        # Uses SHA-256 for a uniform, large 2^256 hash space.
-        return int(hashlib.sha256(key.encode("utf-8")).hexdigest(), 16)
-
-    # Helper function: Binary search for the 'lower bound'.
-    # Finds the index of the first hash value in the ring that is >= target.
-    def _lower_bound(self, target: int) -> int:
-        left = 0
-        right = len(self.hash_ring) - 1
-        # Loop continues until left > right. Upon termination, 'left' is the index of the smallest element >= target.
-        while left <= right:
-            mid = (left + right) // 2
-            if self.hash_ring[mid][0] >= target:
-                right = (
-                    mid - 1
-                )  # Potential match found (mid >= target), search left for the true lower bound.
-            else:
-                left = mid + 1  # Target is larger, move search window to the right.
-        return left
+    def add_node(self, node: Node) -> None:
+        self._add_nodes([node])
+
+    def remove_node(self, node: Node) -> None:
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        # Tombstone the node (V flag flips) instead of rebuilding the ring. Lookups walk past its entries, so keys map
+        # exactly as if they were gone. The rebuild is deferred until tombstoned entries reach a quarter of
+        # the ring, so several removals share one compaction.
+        self._tombstones.add(node)
+        self._mark(node, False)
+        if len(self._tombstones) * self.virtual_nodes * 4 >= self._ring_hashes.size:
+            self._compact()
+
+    def _mark(self, node: Node, alive: bool) -> None:
+        # Flip the liveness flags of the node's V ring entries, located by hash: O(V log R), no ring scan.
+        # Same-named nodes share hashes, so each hash may match a run of entries: flag only the node's own.
+        hashes = self._per_node[node]
+        lo = self._ring_hashes.searchsorted(hashes, side="left").tolist()
+        hi = self._ring_hashes.searchsorted(hashes, side="right").tolist()
+        ring_nodes = self._ring_nodes
+        for start, stop in zip(lo, hi):
+            for idx in range(start, stop):
+                if ring_nodes[idx] == node:
+                    self._live[idx] = alive
+
+    def _compact(self) -> None:
+        if not self._tombstones:
+            return
+        # Drop all tombstoned entries in one pass: a vectorised membership test over the uint64 buffer narrows
+        # the candidates, instead of a Node.__eq__ call per ring entry. Hashes depend only on the node name, so
+        # a live node with the same name shares them: a candidate is dropped only if its owner is tombstoned.
+        dead = np.concatenate([self._per_node.pop(node) for node in self._tombstones])
+        keep = ~np.isin(self._ring_hashes, dead)
+        for idx in np.flatnonzero(~keep).tolist():
+            if self._ring_nodes[idx] not in self._tombstones:
+                keep[idx] = True
+        self._tombstones.clear()
+        self._set_ring(self._ring_hashes[keep], self._ring_nodes[keep])
+
+    def _set_ring(self, ring_hashes: np.ndarray, ring_nodes: np.ndarray) -> None:
+        self._ring_hashes = ring_hashes
+        self._ring_nodes = ring_nodes
+        # One liveness flag per entry, so lookups test tombstones with a list index rather than hashing a Node.
+        self._live = [True] * ring_hashes.size
+        for node in self._tombstones:
+            self._mark(node, False)
+        # Plain-list snapshot for single-key lookups: bisect over a list of ints is ~4x faster than over the numpy
+        # buffer (which boxes a numpy scalar per probe). Rebuilt only on topology changes, which are rare.
+        self._lookup = _make_ring_lookup(
+            ring_hashes.tolist(), ring_nodes.tolist(), self._live
+        )
+
+    def get_node(self, key: str) -> Node | None:
+        # Hash the key to find its position on the ring, then search the current ring snapshot.
+        return self._lookup(_xxh3_64(key.encode("utf-8")))
+
+    def get_nodes_batch(self, keys: list[str]) -> list[Node | None]:
+        # Bulk form of get_node for request pipelines: hash all keys into one uint64 array,
+        # then resolve every ring position in a single compiled call.
+        # The batch kernels search the physical ring, so drop pending tombstones first; one compaction
+        # is cheap next to a batch and leaves single-key lookups on the fast path too.
+        self._compact()
+        if not self._ring_hashes.size:
+            return [None] * len(keys)
+        key_hashes = self._hash_many([key.encode("utf-8") for key in keys])
+        if _HAS_NUMBA:
+            out = np.empty(key_hashes.size, dtype=np.int64)
+            _lookup_batch(self._ring_hashes, key_hashes, out)
+        else:
+            # Same lower-bound search, vectorised in C over the contiguous uint64 buffer, then wrap-around.
+            out = self._ring_hashes.searchsorted(key_hashes)
+            out[out == self._ring_hashes.size] = 0
+        return self._ring_nodes[out].tolist()
+
+
+# --- 3. JUMPBACK HASHING ---
+# Ring-free consistent hashing (Ertl, "JumpBackHash", 2024): buckets are numbered 0..N-1 and a key's bucket
+# is computed from its hash with integer arithmetic only. No virtual nodes, no sorted ring to maintain.
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(state: int) -> tuple[int, int]:
+    # One step of the SplitMix64 PRG. Returns (next_state, 64-bit output).
+    state = (state + 0x9E3779B97F4A7C15) & _MASK64
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return state, z ^ (z >> 31)
+
+
+def _jump_back_hash(key_hash: int, num_buckets: int) -> int:
+    # Growing from j to j+1 buckets, a key "jumps" into the new bucket j with probability 1/(j+1).
+    # Its bucket is the last jump below num_buckets, so we walk the jumps backwards from the top.
+    # Within [2^i, 2^(i+1)) at least one jump happens with probability exactly 1/2, and the highest one is
+    # uniform over that interval: one hash bit per interval says whether to look there, a PRG draw says where.
+    if num_buckets <= 1:
+        return 0
+    top = (num_buckets - 1).bit_length() - 1
+    # Bit i set <=> interval [2^i, 2^(i+1)) contains a jump. Bucket 0 is the fallback.
+    intervals = key_hash & ((2 << top) - 1)
+    while intervals:
+        i = intervals.bit_length() - 1
+        # Seeded per interval (not per num_buckets), so growing N only ever moves keys to new buckets.
+        state, r = _splitmix64(key_hash ^ i)
+        bucket = (1 << i) | (r & ((1 << i) - 1))
+        # Only the top interval can overshoot. The next jump below `bucket` is uniform in [0, bucket).
+        while bucket >= num_buckets:
+            state, r = _splitmix64(state)
+            bucket = (r * bucket) >> 64
+        if bucket >= 1 << i:
+            return bucket
+        # Jumped back out of this interval: its lower neighbours decide.
+        intervals ^= 1 << i
+    return 0
+
+
+class JumpBackHashing:
+    def __init__(self, nodes: list[Node]):
+        # The bucket index is the position in this list, so order matters.
+        self.nodes: list[Node] = list(nodes)
 
     def add_node(self, node: Node) -> None:
-        self.nodes.add(node)
-        # Create 'virtual_nodes' to improve key distribution and load balancing.
-        for i in range(self.virtual_nodes):
-            # Create a unique hash key for each virtual node representation.
-            hash_value = self._hash(f"{node.name}:{i}")
-            # Find the correct sorted position using binary search (O(log N)).
-            idx = self._lower_bound(hash_value)
-            # O(N) operation due to list shifting. This is the bottleneck for large rings.
-            self.hash_ring.insert(idx, (hash_value, node))
+        # Bucket N is appended: only the ~1/(N+1) keys whose last jump is N move, all onto the new node.
+        self.nodes.append(node)
+
+    def remove_node(self, node: Node) -> None:
+        if node not in self.nodes:
+            return
+        # Only the last bucket can be dropped without disturbing the others. For any other node, the last node
+        # takes over its slot: the removed node's keys go to it, and the old last bucket's keys spread out (~2/N moved).
+        idx = self.nodes.index(node)
+        last = self.nodes.pop()
+        if idx < len(self.nodes):
+            self.nodes[idx] = last
+
+    def get_node(self, key: str) -> Node | None:
+        if not self.nodes:
+            return None
+        key_hash = _xxh3_64(key.encode("utf-8"))
+        return self.nodes[_jump_back_hash(key_hash, len(self.nodes))]
+
+
+# --- 4. JUMP CONSISTENT HASHING ---
+# Google's Jump Hash (Lamping & Veach, 2014): the forward counterpart of JumpBackHash. O(log N) per lookup,
+# zero state, but buckets can only be appended (or the last one dropped) - a fit for scale-up-only clusters.
+def _jump_hash(key: int, num_buckets: int) -> int:
+    # Simulates growing the cluster one bucket at a time, jumping straight to the next bucket the key moves to.
+    b, j = -1, 0
+    while j < num_buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & _MASK64
+        j = int((b + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return b
+
+
+class JumpHashing:
+    def __init__(self, nodes: list[Node]):
+        # The bucket index is the position in this list, so order matters.
+        self.nodes: list[Node] = list(nodes)
+
+    def add_node(self, node: Node) -> None:
+        # Appending bucket N moves only the ~1/(N+1) keys that now jump to it.
+        self.nodes.append(node)
+
+    def get_node(self, key: str) -> Node | None:
+        if not self.nodes:
+            return None
+        return self.nodes[_jump_hash(_xxh3_64(key.encode("utf-8")), len(self.nodes))]
+
+
+# --- 5. MAGLEV HASHING ---
+# Google's Maglev load balancer (Eisenbud et al., 2016): a fixed-size lookup table of M slots (M prime) maps
+# slot -> node. A lookup is one hash and one table index; the O(M) table build only happens on topology changes.
+def _is_prime(n: int) -> bool:
+    # Trial division: table sizes are small enough (~65537) that this costs nothing next to a table build.
+    if n < 2:
+        return False
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += 1
+    return True
+
+
+class MaglevHashing:
+    def __init__(self, nodes: list[Node], table_size: int = 65537):
+        # table_size must be prime so every node's permutation visits every slot, and much larger than N
+        # for near-perfect balance (each node owns M/N slots, give or take one).
+        if not _is_prime(table_size):
+            raise ValueError(f"table_size must be a prime >= 2, got {table_size}")
+        self.table_size = table_size
+        self.nodes: list[Node] = list(dict.fromkeys(nodes))
+        self._build_table()
+
+    def _build_table(self) -> None:
+        M = self.table_size
+        n = len(self.nodes)
+        # Each node walks its own permutation of the slots: offset, offset + skip, offset + 2*skip, ... (mod M).
+        # Two independent hashes of the name make the permutations differ between nodes.
+        skips = [_xxh3_64(node.name_bytes, seed=1) % (M - 1) + 1 for node in self.nodes]
+        cursors = [_xxh3_64(node.name_bytes) % M for node in self.nodes]
+        # Built as a plain list: per-element writes to a numpy array are far slower from Python.
+        table = [-1] * M
+        filled = 0
+        # Round-robin: each node in turn claims the next free slot of its permutation, until all slots are taken.
+        while filled < M and n:
+            for i in range(n):
+                c, skip = cursors[i], skips[i]
+                while table[c] >= 0:
+                    c = (c + skip) % M
+                table[c] = i
+                cursors[i] = (c + skip) % M
+                filled += 1
+                if filled == M:
+                    break
+        # slot -> Node, so a lookup is a single list index (no node-index indirection, no numpy scalar boxing).
+        self._slot_nodes: list[Node] = [self.nodes[i] for i in table] if n else []
+
+    def add_node(self, node: Node) -> None:
+        if node in self.nodes:
+            return
+        # Permutations depend only on node names, so a rebuild moves ~1/N of the slots to the new node.
+        self.nodes.append(node)
+        self._build_table()
 
     def remove_node(self, node: Node) -> None:
         if node not in self.nodes:
             return
         self.nodes.remove(node)
-        # Rebuild the hash ring by filtering out all entries associated with the removed node.
-        # Filtering is O(N*V) where N*V is the ring size. Requires a full rebuild.
-        self.hash_ring = [(h, n) for (h, n) in self.hash_ring if n != node]
+        self._build_table()
 
     def get_node(self, key: str) -> Node | None:
-        if not self.hash_ring:
+        if not self._slot_nodes:
             return None
+        return self._slot_nodes[_xxh3_64(key.encode("utf-8")) % self.table_size]
 
-        # 1. Hash the key to find its position on the ring.
-        hash_value = self._hash(key)
 
-        # 2. Find the index of the first node hash >= key hash.
-        # This implements the "walk clockwise" rule of consistent hashing.
-        idx = self._lower_bound(hash_value)
+# --- 6. RENDEZVOUS (HIGHEST RANDOM WEIGHT) HASHING ---
+# Thaler & Ravishankar, 1996: every node scores the key with hash(key, node) and the highest score wins.
+# No ring, no virtual nodes, no table: add/remove are O(1) and move exactly the keys that node wins or held (~1/N).
+# The price is O(N) per lookup - one xxh3 call per node - so it suits small clusters (tens of nodes).
+class RendezvousHashing:
+    def __init__(self, nodes: list[Node]):
+        # Physical node -> its xxh3 seed. Seeding the key hash per node scores (key, node) pairs
+        # without concatenating key and node name bytes on every lookup.
+        self.nodes: dict[Node, int] = {}
+        for node in nodes:
+            self.add_node(node)
 
-        # 3. Handle wrap-around: If idx is out of bounds (key hash > all node hashes),
-        # the key wraps back to the first node (index 0).
-        node_idx = 0 if idx >= len(self.hash_ring) else idx
+    def add_node(self, node: Node) -> None:
+        self.nodes[node] = _xxh3_64(node.name_bytes)
+
+    def remove_node(self, node: Node) -> None:
+        self.nodes.pop(node, None)
+
+    def get_node(self, key: str) -> Node | None:
+        key_bytes = key.encode("utf-8")
+        best_weight, best = -1, None
+        for node, seed in self.nodes.items():
+            weight = _xxh3_64(key_bytes, seed)
+            if weight > best_weight:
+                best_weight, best = weight, node
+        return best
+
+
+def map_keys_to_servers(hashing: NormalHashing, keys: list[str]) -> dict[str, str]:
+    mappings = {}
+    for key in keys:
+        # Using get_node and accessing .nodes[index]
+        server_index = hashing.get_node(key)
+        logger.info("%s falls into server %d", key, server_index)
+        mappings[key] = hashing.nodes[server_index].name
+    return mappings
+
+
+def demo_remapping(
+    title: str,
+    hashing: (
+        ConsistentHashing
+        | JumpBackHashing
+        | JumpHashing
+        | MaglevHashing
+        | RendezvousHashing
+    ),
+    keys: list[str],
+    new_node: Node,
+) -> None:
+    # Shared demo for the Node-returning strategies: map keys, add a node, count how many keys moved.
+    print("\n" + "=" * 10 + f" {title} " + "=" * 10)
+
+    # Store initial mappings (N=3)
+    # getattr is used for a safe access, preventing Pylance/runtime errors if get_node returns None.
+    initial_mappings = {
+        key: getattr(hashing.get_node(key), "name", "NO_SERVER") for key in keys
+    }
+    print(f"Initial Mappings: {initial_mappings}")
 
-        return self.hash_ring[node_idx][1]
+    # Add a node
+    hashing.add_node(new_node)
+    logger.info("--- ADDED NODE %s ---", new_node.name)
+
+    # Check new mappings (N=4) - Expect few re-mappings
+    final_mappings = {
+        key: getattr(hashing.get_node(key), "name", "NO_SERVER") for key in keys
+    }
+    print(f"Final Mappings: {final_mappings}")
+
+    # Calculate re-mappings
+    # Expect this number to be much lower than the Normal Hashing count.
+    remap_count = sum(1 for key in keys if initial_mappings[key] != final_mappings[key])
+    print(f"{title} Re-mapped Keys: {remap_count} / {len(keys)}")
 
 
 def main():
@@ -119,26 +518,18 @@ def main():
     normalHashing = NormalHashing(nodes.copy())  # Use a copy for clean start
 
     # Store initial mappings (N=3)
-    normal_initial_mappings = {
-        # Using get_node and accessing nodes[index]
-        key: nodes[normalHashing.get_node(key)].name
-        for key in keys
-    }
+    normal_initial_mappings = map_keys_to_servers(normalHashing, keys)
     print(f"Initial Mappings: {normal_initial_mappings}")
 
     # Add a server
     new_server = Node(name="D", ip="192.168.0.4")
     normalHashing.add_node(new_server)  # Using add_node
-    logging.info(
-        f"--- ADDED SERVER D (Total: {len(normalHashing.nodes)}) ---"
+    logger.info(
+        "--- ADDED SERVER D (Total: %d) ---", len(normalHashing.nodes)
     )  # Using .nodes
 
     # Check new mappings (N=4) - Expect many re-mappings
-    normal_final_mappings = {
-        # Using .nodes and get_node
-        key: normalHashing.nodes[normalHashing.get_node(key)].name
-        for key in keys
-    }
+    normal_final_mappings = map_keys_to_servers(normalHashing, keys)
     print(f"Final Mappings: {normal_final_mappings}")
 
     # Calculate re-mappings
@@ -148,68 +539,96 @@ def main():
     print(f"Normal Hashing Re-mapped Keys: {normal_remap_count} / {len(keys)}")
 
     # --- 2. Consistent Hashing Demonstration ---
-    print("\n" + "=" * 10 + " Consistent Hashing " + "=" * 10)
     # virtual_nodes=100 ensures much better load distribution.
-    consistentHashing = ConsistentHashing(nodes.copy(), virtual_nodes=100)
-
-    # Store initial mappings (N=3)
-    # getattr is used for a safe access, preventing Pylance/runtime errors if get_node returns None.
-    consistent_initial_mappings = {
-        key: getattr(consistentHashing.get_node(key), "name", "NO_SERVER")
-        for key in keys
-    }
-    print(f"Initial Mappings: {consistent_initial_mappings}")
-
-    # Add a node
-    consistentHashing.add_node(new_server)
-    logging.info(f"--- ADDED NODE D ---")
-
-    # Check new mappings (N=4) - Expect few re-mappings
-    consistent_final_mappings = {
-        key: getattr(consistentHashing.get_node(key), "name", "NO_SERVER")
-        for key in keys
-    }
-    print(f"Final Mappings: {consistent_final_mappings}")
+    demo_remapping(
+        "Consistent Hashing",
+        ConsistentHashing(nodes.copy(), virtual_nodes=100),
+        keys,
+        new_server,
+    )
 
-    # Calculate re-mappings
-    # Expect this number to be much lower than the Normal Hashing count.
-    consistent_remap_count = sum(
-        1
-        for key in keys
-        if consistent_initial_mappings[key] != consistent_final_mappings[key]
+    # --- 3. JumpBack Hashing Demonstration ---
+    # Same minimal re-mapping as the ring, without any ring state.
+    demo_remapping("JumpBack Hashing", JumpBackHashing(nodes.copy()), keys, new_server)
+
+    # --- 4. Jump Hashing Demonstration ---
+    # The demo only ever adds nodes, which is exactly the workload Jump Hash is built for.
+    demo_remapping("Jump Hashing", JumpHashing(nodes.copy()), keys, new_server)
+
+    # --- 5. Maglev Hashing Demonstration ---
+    # A prebuilt slot table: O(1) lookups, with the table rebuilt once when D joins.
+    demo_remapping("Maglev Hashing", MaglevHashing(nodes.copy()), keys, new_server)
+
+    # --- 6. Rendezvous Hashing Demonstration ---
+    # Every node scores every key: no ring or table state at all, and only D's winnings move.
+    demo_remapping(
+        "Rendezvous Hashing",
+        RendezvousHashing(nodes.copy()),
+        keys,
+        new_server,
     )
-    print(f"Consistent Hashing Re-mapped Keys: {consistent_remap_count} / {len(keys)}")
 
 
 if __name__ == "__main__":
+    # Configure basic logging for visibility into server assignments
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s][%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
     main()
 
 
 # --- EXPECTED OUTPUT DEMONSTRATING HASHING EFFICIENCY ---
-# The re-mapped key counts below show Consistent Hashing requires far less data migration (1/7 keys)
-# than Normal Hashing (4/7 keys) when a server is added.
+# The re-mapped key counts below show Consistent Hashing requires less data migration (3/7 keys)
+# than Normal Hashing (4/7 keys) when a server is added. With only 7 keys the gap is noisy; on average
+# Consistent Hashing moves ~K/N keys while Normal Hashing moves most of them.
 # ========== Normal Hashing ==========
-# [2025-11-09 01:57:33][INFO] user_1 falls into server 0
-# [2025-11-09 01:57:33][INFO] user_2 falls into server 2
-# [2025-11-09 01:57:33][INFO] user_3 falls into server 0
-# [2025-11-09 01:57:33][INFO] user_4 falls into server 1
-# [2025-11-09 01:57:33][INFO] user_5 falls into server 1
-# [2025-11-09 01:57:33][INFO] user_6 falls into server 2
-# [2025-11-09 01:57:33][INFO] user_7 falls into server 1
-# Initial Mappings: {'user_1': 'A', 'user_2': 'C', 'user_3': 'A', 'user_4': 'B', 'user_5': 'B', 'user_6': 'C', 'user_7': 'B'}
-# [2025-11-09 01:57:33][INFO] --- ADDED SERVER D (Total: 4) ---
-# [2025-11-09 01:57:33][INFO] user_1 falls into server 3
-# [2025-11-09 01:57:33][INFO] user_2 falls into server 1
-# [2025-11-09 01:57:33][INFO] user_3 falls into server 0
-# [2025-11-09 01:57:33][INFO] user_4 falls into server 1
-# [2025-11-09 01:57:33][INFO] user_5 falls into server 1
-# [2025-11-09 01:57:33][INFO] user_6 falls into server 0
-# [2025-11-09 01:57:33][INFO] user_7 falls into server 2
-# Final Mappings: {'user_1': 'D', 'user_2': 'B', 'user_3': 'A', 'user_4': 'B', 'user_5': 'B', 'user_6': 'A', 'user_7': 'C'}
+# [2026-10-15 10:35:08][INFO] user_1 falls into server 1
+# [2026-10-15 10:35:08][INFO] user_2 falls into server 0
+# [2026-10-15 10:35:08][INFO] user_3 falls into server 1
+# [2026-10-15 10:35:08][INFO] user_4 falls into server 1
+# [2026-10-15 10:35:08][INFO] user_5 falls into server 2
+# [2026-10-15 10:35:08][INFO] user_6 falls into server 0
+# [2026-10-15 10:35:08][INFO] user_7 falls into server 2
+# Initial Mappings: {'user_1': 'B', 'user_2': 'A', 'user_3': 'B', 'user_4': 'B', 'user_5': 'C', 'user_6': 'A', 'user_7': 'C'}
+# [2026-10-15 10:35:08][INFO] --- ADDED SERVER D (Total: 4) ---
+# [2026-10-15 10:35:08][INFO] user_1 falls into server 1
+# [2026-10-15 10:35:08][INFO] user_2 falls into server 2
+# [2026-10-15 10:35:08][INFO] user_3 falls into server 1
+# [2026-10-15 10:35:08][INFO] user_4 falls into server 0
+# [2026-10-15 10:35:08][INFO] user_5 falls into server 2
+# [2026-10-15 10:35:08][INFO] user_6 falls into server 2
+# [2026-10-15 10:35:08][INFO] user_7 falls into server 3
+# Final Mappings: {'user_1': 'B', 'user_2': 'C', 'user_3': 'B', 'user_4': 'A', 'user_5': 'C', 'user_6': 'C', 'user_7': 'D'}
 # Normal Hashing Re-mapped Keys: 4 / 7
 
 # ========== Consistent Hashing ==========
-# Initial Mappings: {'user_1': 'B', 'user_2': 'A', 'user_3': 'B', 'user_4': 'B', 'user_5': 'C', 'user_6': 'C', 'user_7': 'B'}
-# [2025-11-09 01:57:33][INFO] --- ADDED NODE D ---
-# Final Mappings: {'user_1': 'B', 'user_2': 'A', 'user_3': 'B', 'user_4': 'B', 'user_5': 'C', 'user_6': 'C', 'user_7': 'D'}
-# Consistent Hashing Re-mapped Keys: 1 / 7
+# Initial Mappings: {'user_1': 'B', 'user_2': 'C', 'user_3': 'A', 'user_4': 'C', 'user_5': 'C', 'user_6': 'C', 'user_7': 'A'}
+# [2026-10-15 10:35:08][INFO] --- ADDED NODE D ---
+# Final Mappings: {'user_1': 'B', 'user_2': 'C', 'user_3': 'D', 'user_4': 'D', 'user_5': 'D', 'user_6': 'C', 'user_7': 'A'}
+# Consistent Hashing Re-mapped Keys: 3 / 7
+
+# ========== JumpBack Hashing ==========
+# Initial Mappings: {'user_1': 'B', 'user_2': 'C', 'user_3': 'B', 'user_4': 'A', 'user_5': 'C', 'user_6': 'C', 'user_7': 'C'}
+# [2026-10-15 10:35:08][INFO] --- ADDED NODE D ---
+# Final Mappings: {'user_1': 'B', 'user_2': 'C', 'user_3': 'B', 'user_4': 'A', 'user_5': 'C', 'user_6': 'C', 'user_7': 'D'}
+# JumpBack Hashing Re-mapped Keys: 1 / 7
+
+# ========== Jump Hashing ==========
+# Initial Mappings: {'user_1': 'B', 'user_2': 'A', 'user_3': 'A', 'user_4': 'A', 'user_5': 'A', 'user_6': 'B', 'user_7': 'A'}
+# [2026-10-15 10:35:08][INFO] --- ADDED NODE D ---
+# Final Mappings: {'user_1': 'B', 'user_2': 'A', 'user_3': 'A', 'user_4': 'D', 'user_5': 'D', 'user_6': 'B', 'user_7': 'A'}
+# Jump Hashing Re-mapped Keys: 2 / 7
+
+# ========== Maglev Hashing ==========
+# Initial Mappings: {'user_1': 'A', 'user_2': 'B', 'user_3': 'B', 'user_4': 'A', 'user_5': 'A', 'user_6': 'C', 'user_7': 'A'}
+# [2026-10-15 10:35:08][INFO] --- ADDED NODE D ---
+# Final Mappings: {'user_1': 'A', 'user_2': 'B', 'user_3': 'D', 'user_4': 'A', 'user_5': 'A', 'user_6': 'C', 'user_7': 'A'}
+# Maglev Hashing Re-mapped Keys: 1 / 7
+
+# ========== Rendezvous Hashing ==========
+# Initial Mappings: {'user_1': 'C', 'user_2': 'A', 'user_3': 'C', 'user_4': 'B', 'user_5': 'C', 'user_6': 'C', 'user_7': 'B'}
+# [2026-10-15 10:35:08][INFO] --- ADDED NODE D ---
+# Final Mappings: {'user_1': 'C', 'user_2': 'A', 'user_3': 'C', 'user_4': 'D', 'user_5': 'D', 'user_6': 'D', 'user_7': 'B'}
+# Rendezvous Hashing Re-mapped Keys: 3 / 7